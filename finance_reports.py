@@ -0,0 +1,348 @@
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering - no windows are opened
+
+import argparse
+import asyncio
+import base64
+import glob
+import hashlib
+import html
+import io
+import json
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from finance_tracker import (valid_transactions, transactions_dataframe, savings_summary, estimate_loan,
+                             plot_monthly_cash_flow, plot_expense_breakdown)
+
+MIN_INTERVAL_HOURS = 1 / 60  # Snapshot folders are named to the second
+
+
+def load_ledger(ledger):
+    """Read a ledger quietly; the batch prints its own per-ledger status."""
+    with open(ledger, 'r') as f:
+        return transactions_dataframe(valid_transactions(json.load(f)))
+
+
+def build_aggregates(df):
+    """Compute every figure the reports need in a single pass over the ledger.
+
+    All monthly statements of a ledger are rendered from these aggregates,
+    so the transactions are grouped once no matter how many months or
+    output formats are requested.
+    """
+    df = df.copy()
+    df['Month'] = df['Date'].dt.to_period('M')
+    income = df[df['Amount'] > 0]
+    expenses = df[df['Amount'] < 0]
+
+    return {
+        'monthly_net': df.groupby('Month')['Amount'].sum(),
+        'monthly_income': income.groupby('Month')['Amount'].sum(),
+        'monthly_expenses': expenses.groupby('Month')['Amount'].sum().abs(),
+        'category_expenses': expenses.groupby(['Month', 'Category'])['Amount'].sum().abs(),
+    }
+
+
+def month_loan(aggregates, month):
+    """Loan estimate from the data up to and including ``month``."""
+    monthly_net = aggregates['monthly_net']
+    income = aggregates['monthly_income']
+    expenses = aggregates['monthly_expenses']
+    # Calendar months spanned so far, like len(df.resample('M', on='Date'))
+    total_months = (month - monthly_net.index.min()).n + 1
+    return estimate_loan(income[income.index <= month].sum(),
+                         expenses[expenses.index <= month].sum(),
+                         total_months)
+
+
+def month_summary(aggregates, month):
+    summary = savings_summary(aggregates['monthly_income'].get(month, 0.0),
+                              aggregates['monthly_expenses'].get(month, 0.0))
+    category = aggregates['category_expenses']
+    if month in category.index.get_level_values('Month'):
+        breakdown = category.xs(month, level='Month').sort_values(ascending=False)
+    else:
+        breakdown = category.iloc[0:0].droplevel('Month')
+    summary['breakdown'] = breakdown
+    return summary
+
+
+def render_figures(aggregates, month, summary):
+    """Build the cash flow and expense charts without touching pyplot state."""
+    # Monthly net cash flow up to and including the statement month
+    monthly_net = aggregates['monthly_net']
+    monthly_net = monthly_net[monthly_net.index <= month]
+    flow_fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(flow_fig)
+    plot_monthly_cash_flow(flow_fig.add_subplot(), monthly_net)
+    flow_fig.tight_layout()
+
+    # Expense breakdown for the statement month
+    pie_fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(pie_fig)
+    plot_expense_breakdown(pie_fig.add_subplot(), summary['breakdown'], f'Expense Breakdown - {month}')
+    return [flow_fig, pie_fig]
+
+
+def figure_to_base64(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
+
+def render_html(title, summary, loan, figures):
+    rows = ''.join(
+        f"<tr><td>{html.escape(str(cat))}</td><td>₹{amount:,.2f}</td></tr>"
+        for cat, amount in summary['breakdown'].items()
+    ) or '<tr><td colspan="2">No expenses recorded.</td></tr>'
+    if loan['max_emi'] > 0:
+        loan_text = (f"₹{loan['loan_amount']:,.2f} @ {loan['interest_rate']*100}% "
+                     f"for {loan['tenure_years']} years")
+    else:
+        loan_text = "Insufficient disposable income for loan EMI."
+    charts = ''.join(f'<img src="data:image/png;base64,{figure_to_base64(fig)}">' for fig in figures)
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+    body {{font-family: sans-serif; margin: 2rem;}}
+    table {{border-collapse: collapse; margin-bottom: 1.5rem;}}
+    td, th {{border: 1px solid #ccc; padding: 0.4rem 1rem; text-align: left;}}
+    img {{max-width: 100%; display: block; margin-bottom: 1.5rem;}}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<h2>Financial Summary</h2>
+<table>
+<tr><th>Total Income</th><td>₹{summary['total_income']:,.2f}</td></tr>
+<tr><th>Total Expenses</th><td>₹{summary['total_expenses']:,.2f}</td></tr>
+<tr><th>Net Savings</th><td>₹{summary['net_savings']:,.2f}</td></tr>
+<tr><th>Savings Rate</th><td>{summary['savings_rate']:.2f}%</td></tr>
+</table>
+<h2>Expenses by Category</h2>
+<table>
+<tr><th>Category</th><th>Amount</th></tr>
+{rows}
+</table>
+<h2>Loan Eligibility Estimate</h2>
+<table>
+<tr><th>Avg Monthly Income</th><td>₹{loan['avg_monthly_income']:,.2f}</td></tr>
+<tr><th>Avg Monthly Expenses</th><td>₹{loan['avg_monthly_expenses']:,.2f}</td></tr>
+<tr><th>Disposable Income</th><td>₹{loan['disposable']:,.2f}</td></tr>
+<tr><th>Max EMI ({loan['max_emi_ratio']*100:.0f}%)</th><td>₹{loan['max_emi']:,.2f}</td></tr>
+<tr><th>Eligible Loan Amount</th><td>{loan_text}</td></tr>
+</table>
+<h2>Charts</h2>
+{charts}
+</body>
+</html>
+"""
+
+
+def render_summary_page(title, summary, loan):
+    """Render the summary tables as a text page for the PDF report."""
+    lines = [
+        "Financial Summary",
+        f"  Total Income       : ₹{summary['total_income']:,.2f}",
+        f"  Total Expenses     : ₹{summary['total_expenses']:,.2f}",
+        f"  Net Savings        : ₹{summary['net_savings']:,.2f}",
+        f"  Savings Rate       : {summary['savings_rate']:.2f}%",
+        "",
+        "Expenses by Category",
+    ]
+    if summary['breakdown'].empty:
+        lines.append("  No expenses recorded.")
+    for cat, amount in summary['breakdown'].items():
+        lines.append(f"  {str(cat):<18} : ₹{amount:,.2f}")
+    lines += [
+        "",
+        "Loan Eligibility Estimate",
+        f"  Avg Monthly Income   : ₹{loan['avg_monthly_income']:,.2f}",
+        f"  Avg Monthly Expenses : ₹{loan['avg_monthly_expenses']:,.2f}",
+        f"  Disposable Income    : ₹{loan['disposable']:,.2f}",
+        f"  Max EMI ({loan['max_emi_ratio']*100:.0f}%)        : ₹{loan['max_emi']:,.2f}",
+    ]
+    if loan['max_emi'] > 0:
+        lines.append(f"  Eligible Loan Amount : ₹{loan['loan_amount']:,.2f} "
+                     f"@ {loan['interest_rate']*100}% for {loan['tenure_years']} years")
+    else:
+        lines.append("  Insufficient disposable income for loan EMI.")
+
+    fig = Figure(figsize=(8.27, 11.69))  # A4 portrait
+    FigureCanvasAgg(fig)
+    fig.text(0.08, 0.95, title, fontsize=16, weight='bold', va='top')
+    fig.text(0.08, 0.90, '\n'.join(lines), fontsize=10, family='monospace', va='top')
+    return fig
+
+
+def report_names(ledgers):
+    """Output file stem per ledger; ledgers sharing a file name get a short path hash."""
+    stems = [os.path.splitext(os.path.basename(ledger))[0] for ledger in ledgers]
+    names = []
+    for ledger, stem in zip(ledgers, stems):
+        if stems.count(stem) > 1:
+            stem += '_' + hashlib.sha1(os.path.realpath(ledger).encode()).hexdigest()[:8]
+        names.append(stem)
+    return names
+
+
+def generate_ledger_reports(ledger, name, out_dir, months=None, formats=('html', 'pdf')):
+    """Render the statements of one ledger.
+
+    Runs in a worker process; ``months`` is a list of monthly periods and
+    defaults to the latest month in the ledger. Returns the written paths
+    and the requested months the ledger has no transactions for.
+    """
+    df = load_ledger(ledger)
+    if df.empty:
+        return [], []
+
+    aggregates = build_aggregates(df)
+    available = aggregates['monthly_net'].index
+    if months:
+        periods = [m for m in months if m in available]
+        unmatched = [m for m in months if m not in available]
+    else:
+        periods = [available.max()]
+        unmatched = []
+
+    written = []
+    for month in periods:
+        summary = month_summary(aggregates, month)
+        loan = month_loan(aggregates, month)
+        title = f"{name} - Statement for {month}"
+        figures = render_figures(aggregates, month, summary)
+        base = os.path.join(out_dir, f"{name}_{month}")
+
+        if 'html' in formats:
+            with open(base + '.html', 'w', encoding='utf-8') as f:
+                f.write(render_html(title, summary, loan, figures))
+            written.append(base + '.html')
+        if 'pdf' in formats:
+            with PdfPages(base + '.pdf') as pdf:
+                pdf.savefig(render_summary_page(title, summary, loan))
+                for fig in figures:
+                    pdf.savefig(fig)
+            written.append(base + '.pdf')
+    return written, unmatched
+
+
+async def run_batch(ledgers, out_dir, months=None, formats=('html', 'pdf'), workers=None):
+    """Render reports for all ledgers concurrently in a process pool."""
+    missing = [ledger for ledger in ledgers if not os.path.exists(ledger)]
+    for ledger in missing:
+        print(f"✗ {ledger}: file not found")
+    # The same file given twice is rendered once
+    unique = {}
+    for ledger in ledgers:
+        if ledger not in missing:
+            unique.setdefault(os.path.realpath(ledger), ledger)
+    ledgers = list(unique.values())
+    if not ledgers:
+        return []
+
+    os.makedirs(out_dir, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [loop.run_in_executor(pool, generate_ledger_reports, ledger, name, out_dir, months, formats)
+                for ledger, name in zip(ledgers, report_names(ledgers))]
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+
+    written = []
+    for ledger, result in zip(ledgers, results):
+        if isinstance(result, Exception):
+            print(f"✗ {ledger}: {result}")
+            continue
+        files, unmatched = result
+        written.extend(files)
+        note = f" (no transactions in {', '.join(str(m) for m in unmatched)})" if unmatched else ""
+        if files:
+            print(f"✓ {ledger}: {len(files)} file(s){note}")
+        elif unmatched:
+            print(f"- {ledger}: nothing to report{note}")
+        else:
+            print(f"- {ledger}: no transactions, skipped")
+    return written
+
+
+async def run_scheduled(ledgers, pattern, out_dir, interval_hours, formats=('html', 'pdf'), workers=None):
+    """Export a snapshot of the latest month for every ledger, every interval.
+
+    Explicit ``ledgers`` are exported as given; otherwise ``pattern`` is
+    globbed again before each snapshot so new ledgers are picked up.
+    """
+    while True:
+        batch = ledgers or sorted(glob.glob(pattern))
+        snapshot_dir = os.path.join(out_dir, datetime.now().strftime("%Y%m%d_%H%M%S"))
+        print(f"Snapshot export to {snapshot_dir} ({len(batch)} ledgers)")
+        await run_batch(batch, snapshot_dir, formats=formats, workers=workers)
+        await asyncio.sleep(interval_hours * 3600)
+
+
+def month_arg(value):
+    if not re.fullmatch(r'\d{4}-\d{2}', value):
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM")
+    try:
+        return pd.Period(value, 'M')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM")
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def interval_hours(value):
+    number = float(value)
+    if not math.isfinite(number) or number < MIN_INTERVAL_HOURS:
+        raise argparse.ArgumentTypeError(f"must be at least {MIN_INTERVAL_HOURS * 60:.0f} minute, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate monthly finance statements as HTML/PDF.")
+    parser.add_argument('ledgers', nargs='*', help="Ledger JSON files (default: all matching --pattern)")
+    parser.add_argument('--pattern', default='finance*.json', help="Glob used when no ledgers are given")
+    parser.add_argument('--month', type=month_arg, action='append',
+                        help="Statement month YYYY-MM (repeatable, default: latest)")
+    parser.add_argument('--format', choices=['html', 'pdf'], action='append', help="Output format (default: both)")
+    parser.add_argument('--out', default='reports', help="Output directory")
+    parser.add_argument('--workers', type=positive_int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--every', type=interval_hours, default=None, metavar='HOURS',
+                        help="Keep running and export a snapshot of the latest month every HOURS")
+    args = parser.parse_args()
+
+    if args.every is not None and args.month:
+        parser.error("--month cannot be used with --every; snapshots always cover the latest month")
+
+    formats = tuple(args.format or ('html', 'pdf'))
+    if args.every is not None:
+        asyncio.run(run_scheduled(args.ledgers, args.pattern, args.out, args.every, formats, args.workers))
+        return
+
+    ledgers = args.ledgers or sorted(glob.glob(args.pattern))
+    if not ledgers:
+        print("No ledgers found.")
+        return
+    written = asyncio.run(run_batch(ledgers, args.out, args.month, formats, args.workers))
+    print(f"\n{len(written)} report file(s) written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,74 @@ import json
 import os
 from datetime import datetime
 
+REQUIRED_KEYS = ['Date', 'Category', 'Amount', 'Type']
+
+def valid_transactions(data):
+    return [trans for trans in data if all(key in trans for key in REQUIRED_KEYS)]
+
+def transactions_dataframe(transactions):
+    if not transactions:
+        return pd.DataFrame()
+    df = pd.DataFrame(transactions)
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df.sort_values('Date')
+
+def savings_summary(total_income, total_expenses):
+    net_savings = total_income - total_expenses
+    return {
+        'total_income': total_income,
+        'total_expenses': total_expenses,
+        'net_savings': net_savings,
+        'savings_rate': (net_savings / total_income * 100) if total_income > 0 else 0,
+    }
+
+def estimate_loan(total_income, total_expenses, total_months, max_emi_ratio=0.4, tenure_years=20, interest_rate=0.09):
+    avg_monthly_income = total_income / max(total_months, 1)
+    avg_monthly_expenses = total_expenses / max(total_months, 1)
+    disposable = avg_monthly_income - avg_monthly_expenses
+    max_emi = disposable * max_emi_ratio
+
+    loan_amount = 0.0
+    if max_emi > 0:
+        monthly_rate = interest_rate / 12
+        months = tenure_years * 12
+        loan_amount = max_emi * ((1 + monthly_rate)**months - 1) / (monthly_rate * (1 + monthly_rate)**months)
+
+    return {
+        'avg_monthly_income': avg_monthly_income,
+        'avg_monthly_expenses': avg_monthly_expenses,
+        'disposable': disposable,
+        'max_emi': max_emi,
+        'max_emi_ratio': max_emi_ratio,
+        'loan_amount': loan_amount,
+        'interest_rate': interest_rate,
+        'tenure_years': tenure_years,
+    }
+
+def plot_monthly_cash_flow(ax, monthly_net):
+    bars = ax.bar(range(len(monthly_net)), monthly_net.values,
+                  color=['green' if x > 0 else 'red' for x in monthly_net.values])
+    ax.set_title('Monthly Net Cash Flow')
+    ax.set_ylabel('Amount (₹)')
+    ax.set_xlabel('Month')
+    ax.set_xticks(range(len(monthly_net)))
+    ax.set_xticklabels([str(m) for m in monthly_net.index], rotation=45)
+    ax.grid(axis='y', alpha=0.3)
+
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + (height/abs(height))*500 if height != 0 else 500,
+                f'₹{height:,.0f}', ha='center', va='bottom' if height > 0 else 'top')
+
+def plot_expense_breakdown(ax, expenses, title='Expense Breakdown by Category'):
+    if len(expenses) > 1:
+        ax.pie(expenses, labels=expenses.index, autopct='%1.1f%%', startangle=90)
+    else:
+        ax.text(0.5, 0.5, 'Not enough\ncategories', ha='center', va='center', fontsize=14)
+        ax.axis('off')
+    ax.set_title(title)
+
 class PersonalFinanceTracker:
     def __init__(self, filename='finance_data_2025.json'):
         self.filename = filename
@@ -14,10 +82,7 @@ class PersonalFinanceTracker:
         if os.path.exists(self.filename):
             try:
                 with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    for trans in data:
-                        if all(key in trans for key in ['Date', 'Category', 'Amount', 'Type']):
-                            self.transactions.append(trans)
+                    self.transactions.extend(valid_transactions(json.load(f)))
                     print(f"Data loaded: {len(self.transactions)} transactions\n")
             except Exception as e:
                 print(f"Error loading data: {e}. Starting fresh.\n")
@@ -55,11 +120,7 @@ class PersonalFinanceTracker:
             return False
 
     def get_dataframe(self):
-        if not self.transactions:
-            return pd.DataFrame()
-        df = pd.DataFrame(self.transactions)
-        df['Date'] = pd.to_datetime(df['Date'])
-        return df.sort_values('Date')
+        return transactions_dataframe(self.transactions)
 
     def analyze_statements(self):
         df = self.get_dataframe()
@@ -67,15 +128,13 @@ class PersonalFinanceTracker:
             print("No transactions to analyze yet.\n")
             return
         
-        total_income = df[df['Amount'] > 0]['Amount'].sum()
-        total_expenses = abs(df[df['Amount'] < 0]['Amount'].sum())
-        net_savings = total_income - total_expenses
+        summary = savings_summary(df[df['Amount'] > 0]['Amount'].sum(), abs(df[df['Amount'] < 0]['Amount'].sum()))
         
         print("=== 2025/2026 Financial Summary ===")
-        print(f"Total Income       : ₹{total_income:,.2f}")
-        print(f"Total Expenses     : ₹{total_expenses:,.2f}")
-        print(f"Net Savings        : ₹{net_savings:,.2f}")
-        print(f"Savings Rate       : {(net_savings / total_income * 100) if total_income > 0 else 0:.2f}%\n")
+        print(f"Total Income       : ₹{summary['total_income']:,.2f}")
+        print(f"Total Expenses     : ₹{summary['total_expenses']:,.2f}")
+        print(f"Net Savings        : ₹{summary['net_savings']:,.2f}")
+        print(f"Savings Rate       : {summary['savings_rate']:.2f}%\n")
 
         print("Expenses by Category:")
         expenses = df[df['Amount'] < 0].groupby('Category')['Amount'].sum().abs()
@@ -93,25 +152,19 @@ class PersonalFinanceTracker:
         
         # Assuming 12 months of data or annualized
         total_months = len(df.resample('M', on='Date')) if 'Date' in df.columns else 1
-        avg_monthly_income = df[df['Amount'] > 0]['Amount'].sum() / max(total_months, 1)
-        avg_monthly_expenses = abs(df[df['Amount'] < 0]['Amount'].sum()) / max(total_months, 1)
-        disposable = avg_monthly_income - avg_monthly_expenses
-        max_emi = disposable * max_emi_ratio
+        loan = estimate_loan(df[df['Amount'] > 0]['Amount'].sum(), abs(df[df['Amount'] < 0]['Amount'].sum()),
+                             total_months, max_emi_ratio, tenure_years, interest_rate)
 
-        if max_emi <= 0:
+        if loan['max_emi'] <= 0:
             print("Insufficient disposable income for loan EMI.\n")
             return
 
-        monthly_rate = interest_rate / 12
-        months = tenure_years * 12
-        loan_amount = max_emi * ((1 + monthly_rate)**months - 1) / (monthly_rate * (1 + monthly_rate)**months)
-
         print("=== Loan Eligibility Estimate ===")
-        print(f"Avg Monthly Income   : ₹{avg_monthly_income:,.2f}")
-        print(f"Avg Monthly Expenses : ₹{avg_monthly_expenses:,.2f}")
-        print(f"Disposable Income    : ₹{disposable:,.2f}")
-        print(f"Max EMI (40%)        : ₹{max_emi:,.2f}")
-        print(f"Eligible Loan Amount : ₹{loan_amount:,.2f} @ {interest_rate*100}% for {tenure_years} years\n")
+        print(f"Avg Monthly Income   : ₹{loan['avg_monthly_income']:,.2f}")
+        print(f"Avg Monthly Expenses : ₹{loan['avg_monthly_expenses']:,.2f}")
+        print(f"Disposable Income    : ₹{loan['disposable']:,.2f}")
+        print(f"Max EMI ({max_emi_ratio*100:.0f}%)        : ₹{loan['max_emi']:,.2f}")
+        print(f"Eligible Loan Amount : ₹{loan['loan_amount']:,.2f} @ {interest_rate*100}% for {tenure_years} years\n")
 
     def visualize_trends(self):
         df = self.get_dataframe()
@@ -123,20 +176,8 @@ class PersonalFinanceTracker:
         df['Month'] = df['Date'].dt.to_period('M')
         df_monthly = df.groupby('Month')['Amount'].sum()
         
-        plt.figure(figsize=(12, 6))
-        bars = plt.bar(range(len(df_monthly)), df_monthly.values, 
-                       color=['green' if x > 0 else 'red' for x in df_monthly.values])
-        plt.title('Monthly Net Cash Flow')
-        plt.ylabel('Amount (₹)')
-        plt.xlabel('Month')
-        plt.xticks(range(len(df_monthly)), [str(m) for m in df_monthly.index], rotation=45)
-        plt.grid(axis='y', alpha=0.3)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + (height/abs(height))*500 if height != 0 else 500,
-                     f'₹{height:,.0f}', ha='center', va='bottom' if height > 0 else 'top')
+        fig, ax = plt.subplots(figsize=(12, 6))
+        plot_monthly_cash_flow(ax, df_monthly)
         
         plt.tight_layout()
         plt.show()
@@ -144,9 +185,8 @@ class PersonalFinanceTracker:
         # Expense pie chart
         expenses = df[df['Amount'] < 0].groupby('Category')['Amount'].sum().abs()
         if not expenses.empty and len(expenses) > 1:
-            plt.figure(figsize=(8, 8))
-            plt.pie(expenses, labels=expenses.index, autopct='%1.1f%%', startangle=90)
-            plt.title('Expense Breakdown by Category')
+            fig, ax = plt.subplots(figsize=(8, 8))
+            plot_expense_breakdown(ax, expenses)
             plt.show()
         elif len(expenses) == 1:
             print("Only one expense category — skipping pie chart.\n")
@@ -7,6 +7,9 @@ import json
 import os
 from datetime import datetime
 
+from finance_tracker import (valid_transactions, transactions_dataframe, savings_summary, estimate_loan,
+                             plot_monthly_cash_flow, plot_expense_breakdown)
+
 class PersonalFinanceTrackerGUI:
     def __init__(self, root):
         self.root = root
@@ -25,10 +28,7 @@ class PersonalFinanceTrackerGUI:
         if os.path.exists(self.filename):
             try:
                 with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    for trans in data:
-                        if all(k in trans for k in ['Date', 'Category', 'Amount', 'Type']):
-                            self.transactions.append(trans)
+                    self.transactions.extend(valid_transactions(json.load(f)))
             except Exception as e:
                 messagebox.showerror("Error", f"Could not load data: {e}")
 
@@ -80,11 +80,7 @@ class PersonalFinanceTrackerGUI:
             messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
 
     def get_dataframe(self):
-        if not self.transactions:
-            return pd.DataFrame()
-        df = pd.DataFrame(self.transactions)
-        df['Date'] = pd.to_datetime(df['Date'])
-        return df.sort_values('Date')
+        return transactions_dataframe(self.transactions)
 
     def refresh_summary(self):
         df = self.get_dataframe()
@@ -92,16 +88,13 @@ class PersonalFinanceTrackerGUI:
             self.summary_label.config(text="No transactions yet. Add some to get started!")
             return
 
-        total_income = df[df['Amount'] > 0]['Amount'].sum()
-        total_expenses = abs(df[df['Amount'] < 0]['Amount'].sum())
-        net_savings = total_income - total_expenses
-        savings_rate = (net_savings / total_income * 100) if total_income > 0 else 0
+        summary = savings_summary(df[df['Amount'] > 0]['Amount'].sum(), abs(df[df['Amount'] < 0]['Amount'].sum()))
 
         summary_text = (
-            f"Total Income: ₹{total_income:,.2f}    |    "
-            f"Total Expenses: ₹{total_expenses:,.2f}\n"
-            f"Net Savings: ₹{net_savings:,.2f}    |    "
-            f"Savings Rate: {savings_rate:.1f}%"
+            f"Total Income: ₹{summary['total_income']:,.2f}    |    "
+            f"Total Expenses: ₹{summary['total_expenses']:,.2f}\n"
+            f"Net Savings: ₹{summary['net_savings']:,.2f}    |    "
+            f"Savings Rate: {summary['savings_rate']:.1f}%"
         )
         self.summary_label.config(text=summary_text)
 
@@ -129,25 +122,18 @@ class PersonalFinanceTrackerGUI:
             return
 
         months = max(len(df.resample('M', on='Date')), 1)
-        avg_income = df[df['Amount'] > 0]['Amount'].sum() / months
-        avg_expense = abs(df[df['Amount'] < 0]['Amount'].sum()) / months
-        disposable = avg_income - avg_expense
-        max_emi = disposable * 0.4
+        loan = estimate_loan(df[df['Amount'] > 0]['Amount'].sum(), abs(df[df['Amount'] < 0]['Amount'].sum()), months)
 
-        if max_emi <= 0:
+        if loan['max_emi'] <= 0:
             messagebox.showinfo("Loan Eligibility", "Insufficient disposable income for loan EMI.")
             return
 
-        monthly_rate = 0.09 / 12
-        months_tenure = 20 * 12
-        loan_amount = max_emi * ((1 + monthly_rate)**months_tenure - 1) / (monthly_rate * (1 + monthly_rate)**months_tenure)
-
         info = (
-            f"Avg Monthly Income: ₹{avg_income:,.2f}\n"
-            f"Avg Monthly Expenses: ₹{avg_expense:,.2f}\n"
-            f"Disposable Income: ₹{disposable:,.2f}\n"
-            f"Max EMI (40%): ₹{max_emi:,.2f}\n\n"
-            f"Eligible Loan Amount:\n₹{loan_amount:,.2f}\n@ 9% interest for 20 years"
+            f"Avg Monthly Income: ₹{loan['avg_monthly_income']:,.2f}\n"
+            f"Avg Monthly Expenses: ₹{loan['avg_monthly_expenses']:,.2f}\n"
+            f"Disposable Income: ₹{loan['disposable']:,.2f}\n"
+            f"Max EMI (40%): ₹{loan['max_emi']:,.2f}\n\n"
+            f"Eligible Loan Amount:\n₹{loan['loan_amount']:,.2f}\n@ 9% interest for 20 years"
         )
         messagebox.showinfo("Loan Eligibility", info)
 
@@ -164,22 +150,12 @@ class PersonalFinanceTrackerGUI:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
         # Monthly Cash Flow
-        df_monthly = df.resample('M', on='Date')['Amount'].sum()
-        ax1.bar(df_monthly.index.strftime('%b %Y'), df_monthly.values,
-                color=['green' if x > 0 else 'red' for x in df_monthly.values])
-        ax1.set_title('Monthly Net Cash Flow')
-        ax1.set_ylabel('Amount (₹)')
-        ax1.tick_params(axis='x', rotation=45)
-        ax1.grid(axis='y', alpha=0.3)
+        df_monthly = df.groupby(df['Date'].dt.to_period('M'))['Amount'].sum()
+        plot_monthly_cash_flow(ax1, df_monthly)
 
         # Expense Pie
         expenses = df[df['Amount'] < 0].groupby('Category')['Amount'].sum().abs()
-        if len(expenses) > 1:
-            ax2.pie(expenses, labels=expenses.index, autopct='%1.1f%%', startangle=90)
-            ax2.set_title('Expense Breakdown')
-        else:
-            ax2.text(0.5, 0.5, 'Not enough\ncategories', ha='center', va='center', fontsize=14)
-            ax2.set_title('Expense Breakdown')
+        plot_expense_breakdown(ax2, expenses, 'Expense Breakdown')
 
         plt.tight_layout()
         canvas = FigureCanvasTkAgg(fig, chart_window)